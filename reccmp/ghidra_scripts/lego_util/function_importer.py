@@ -124,6 +124,17 @@ class FullPdbFunctionImporter(PdbFunctionImporter):
             for (index, type_name) in enumerate(self.signature.arglist)
         ]
 
+        # Index the stack symbols so each parameter lookup below is O(1).
+        # Keep the first symbol on a duplicate offset/register, matching the
+        # former linear search.
+        self._stack_symbols_by_offset: dict[int, CppStackSymbol] = {}
+        self._register_symbols_by_register: dict[str, CppRegisterSymbol] = {}
+        for symbol in self.signature.stack_symbols:
+            if isinstance(symbol, CppStackSymbol):
+                self._stack_symbols_by_offset.setdefault(symbol.stack_offset, symbol)
+            elif isinstance(symbol, CppRegisterSymbol):
+                self._register_symbols_by_register.setdefault(symbol.register, symbol)
+
     def matches_ghidra_function(self, ghidra_function: Function) -> bool:
         """Checks whether this function declaration already matches the description in Ghidra"""
         name_match = self.name == ghidra_function.getName(False)
@@ -341,25 +352,10 @@ class FullPdbFunctionImporter(PdbFunctionImporter):
         param.setName(name, SourceType.USER_DEFINED)
 
     def get_matching_stack_symbol(self, stack_offset: int) -> CppStackSymbol | None:
-        return next(
-            (
-                symbol
-                for symbol in self.signature.stack_symbols
-                if isinstance(symbol, CppStackSymbol)
-                and symbol.stack_offset == stack_offset
-            ),
-            None,
-        )
+        return self._stack_symbols_by_offset.get(stack_offset)
 
     def get_matching_register_symbol(self, register: str) -> CppRegisterSymbol | None:
-        return next(
-            (
-                symbol
-                for symbol in self.signature.stack_symbols
-                if isinstance(symbol, CppRegisterSymbol) and symbol.register == register
-            ),
-            None,
-        )
+        return self._register_symbols_by_register.get(register)
 
     def _set_this_adjust(
         self,
@@ -107,6 +107,9 @@ def get_or_create_namespace(
 # These appear in debug builds
 THUNK_OF_RE = re.compile(r"^Thunk of '(.*)'$")
 
+# Ghidra's auto-generated function names
+FUN_NAME_RE = re.compile(r"FUN_([0-9a-f]{8})")
+
 
 def sanitize_name(name: str) -> str:
     """
@@ -134,7 +137,7 @@ def sanitize_name(name: str) -> str:
 
     # FIXME: The identification here is a crutch - we need a more reusable solution for this scenario
     if GLOBALS.target_name.upper() == "BETA10.DLL":
-        new_name = re.sub(r"FUN_([0-9a-f]{8})", r"LEGO1_\1", new_name)
+        new_name = FUN_NAME_RE.sub(r"LEGO1_\1", new_name)
 
     if "<" in name:
         new_name = "_template_" + new_name
@@ -4,32 +4,39 @@ from typing import Any
 import logging
 
 from reccmp.isledecomp.formats.exceptions import InvalidVirtualAddressError
+from reccmp.isledecomp.cvdump.analysis import CvdumpNode
 from reccmp.isledecomp.cvdump.symbols import SymbolsEntry
 from reccmp.isledecomp.compare import Compare
 from reccmp.isledecomp.compare.db import ReccmpMatch
 
 logger = logging.getLogger(__file__)
 
+_CALL_TYPE_MAP = {
+    "ThisCall": "__thiscall",
+    "C Near": "default",
+    "STD Near": "__stdcall",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class CppStackOrRegisterSymbol:
     name: str
     data_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CppStackSymbol(CppStackOrRegisterSymbol):
     stack_offset: int
     """Should have a value iff `symbol_type=='S_BPREL32'."""
 
 
-@dataclass
+@dataclass(slots=True)
 class CppRegisterSymbol(CppStackOrRegisterSymbol):
     register: str
     """Should have a value iff `symbol_type=='S_REGISTER'.` Should always be set/converted to lowercase."""
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionSignature:
     original_function_symbol: SymbolsEntry
     call_type: str
@@ -41,7 +48,7 @@ class FunctionSignature:
     this_adjust: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PdbFunction:
     match_info: ReccmpMatch
     signature: FunctionSignature | None
@@ -56,21 +63,33 @@ class PdbFunctionExtractor:
 
     def __init__(self, compare: Compare):
         self.compare = compare
+        # Type lookups repeat heavily across functions. Cache them by the raw
+        # (not lowercased) type name to avoid the string churn per call.
+        self._type_cache: dict[str, dict[str, Any] | None] = {}
+        # The nodes are fixed once the cvdump analysis is done, so index them
+        # by address up front. A linear search per function would make
+        # get_function_list() quadratic. Keep the first node per address:
+        # the linear search returned the first hit, and the compare ingest
+        # skips duplicate addresses the same way.
+        self._nodes_by_addr: dict[int | None, CvdumpNode] = {}
+        for node in compare.cvdump_analysis.nodes:
+            self._nodes_by_addr.setdefault(node.addr, node)
+
+    # The type id is hexadecimal, e.g. "t_char16(007a)".
+    scalar_type_regex = re.compile(
+        r"t_(?P<typename>\w+)(?:\((?P<type_id>[0-9a-f]+)\))?"
+    )
 
-    scalar_type_regex = re.compile(r"t_(?P<typename>\w+)(?:\((?P<type_id>\d+)\))?")
+    def _get_cvdump_type(self, type_name: str | None) -> dict[str, Any] | None:
+        if type_name is None:
+            return None
 
-    _call_type_map = {
-        "ThisCall": "__thiscall",
-        "C Near": "default",
-        "STD Near": "__stdcall",
-    }
+        if type_name not in self._type_cache:
+            self._type_cache[type_name] = self.compare.cv.types.keys.get(
+                type_name.lower()
+            )
 
-    def _get_cvdump_type(self, type_name: str | None) -> dict[str, Any] | None:
-        return (
-            None
-            if type_name is None
-            else self.compare.cv.types.keys.get(type_name.lower())
-        )
+        return self._type_cache[type_name]
 
     def get_func_signature(self, fn: SymbolsEntry) -> FunctionSignature | None:
         function_type_str = fn.func_type
@@ -80,7 +99,7 @@ class PdbFunctionExtractor:
 
         # get corresponding function type
 
-        function_type = self.compare.cv.types.keys.get(function_type_str.lower())
+        function_type = self._get_cvdump_type(function_type_str)
         if function_type is None:
             logger.error(
                 "Could not find function type %s for function %s", fn.func_type, fn.name
@@ -119,7 +138,7 @@ class PdbFunctionExtractor:
                     )
                 )
 
-        call_type = self._call_type_map[function_type["call_type"]]
+        call_type = _CALL_TYPE_MAP.get(function_type["call_type"], "default")
 
         # parse as hex number, default to 0
         this_adjust = int(function_type.get("this_adjust", "0"), 16)
@@ -142,14 +161,7 @@ class PdbFunctionExtractor:
         return [signature for signature in handled if signature is not None]
 
     def handle_matched_function(self, match_info: ReccmpMatch) -> PdbFunction | None:
-        function_data = next(
-            (
-                y
-                for y in self.compare.cvdump_analysis.nodes
-                if y.addr == match_info.recomp_addr
-            ),
-            None,
-        )
+        function_data = self._nodes_by_addr.get(match_info.recomp_addr)
         if function_data is None:
             try:
                 # this can be either a thunk (which we want) or an external function
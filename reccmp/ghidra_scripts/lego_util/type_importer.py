@@ -136,7 +136,9 @@ class PdbTypeImporter:
         return self._scalar_type_map.get(scalar_type, scalar_type)
 
     def _import_scalar_type(self, type_index_lower: str) -> DataType:
-        if (match := self.extraction.scalar_type_regex.match(type_index_lower)) is None:
+        if (
+            match := self.extraction.scalar_type_regex.fullmatch(type_index_lower)
+        ) is None:
             raise TypeNotFoundError(f"Type has unexpected format: {type_index_lower}")
 
         scalar_cpp_type = self._scalar_type_to_cpp(match.group("typename"))
@@ -127,6 +127,7 @@ class Compare:
 
         self._load_cvdump()
         self._load_markers(report)
+        self._db.analyze()
 
         # Match using PDB and annotation data
         match_symbols(self._db, report, truncate=True)
@@ -585,6 +586,7 @@ class Compare:
             recomp_thunks.setdefault(func_addr, []).append(thunk_addr)
 
         # Now match the thunks from orig where we can.
+        matched_thunks = []
         for orig_thunk, orig_addr in self.orig_bin.thunks:
             orig_func = self._db.get_by_orig(orig_addr)
             if orig_func is None or orig_func.recomp_addr is None:
@@ -602,15 +604,17 @@ class Compare:
             if len(recomp_thunks[orig_func.recomp_addr]) == 0:
                 del recomp_thunks[orig_func.recomp_addr]
 
-            self._db.set_function_pair(orig_thunk, recomp_thunk)
+            matched_thunks.append((orig_thunk, recomp_thunk))
 
-            # Don't compare thunk functions for now. The comparison isn't
-            # "useful" in the usual sense. We are only looking at the
-            # bytes of the jmp instruction and not the larger context of
-            # where this function is. Also: these will always match 100%
-            # because we are searching for a match to register this as a
-            # function in the first place.
-            self._db.skip_compare(orig_thunk)
+        self._db.bulk_set_function_pair(matched_thunks)
+
+        # Don't compare thunk functions for now. The comparison isn't
+        # "useful" in the usual sense. We are only looking at the
+        # bytes of the jmp instruction and not the larger context of
+        # where this function is. Also: these will always match 100%
+        # because we are searching for a match to register this as a
+        # function in the first place.
+        self._db.bulk_skip_compare(orig for orig, _ in matched_thunks)
 
     def _match_exports(self):
         # invert for name lookup
@@ -663,6 +667,10 @@ class Compare:
         We could do this differently and check only the original vtable,
         construct the name of the vtordisp function and match based on that."""
 
+        # Correct the names of vtordisp functions in one batch
+        # so the per-address check below is a plain query.
+        self._db.fix_vtordisp_names()
+
         for match in self._db.get_matches_by_type(EntityType.VTABLE):
             assert (
                 match.name is not None
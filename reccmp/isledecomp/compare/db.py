@@ -4,12 +4,18 @@ addresses/symbols that we want to compare between the original and recompiled bi
 import sqlite3
 import logging
 import json
-from functools import cached_property
+from bisect import bisect_right, insort
 from typing import Any, Iterable, Iterator
 from reccmp.isledecomp.types import EntityType
 from reccmp.isledecomp.cvdump.demangler import get_vtordisp_name
 
 _SETUP_SQL = """
+    PRAGMA journal_mode = MEMORY;
+    PRAGMA synchronous = OFF;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA locking_mode = EXCLUSIVE;
+    PRAGMA cache_size = -65536;
+
     CREATE TABLE entities (
         orig_addr int unique,
         recomp_addr int unique,
@@ -28,6 +34,27 @@ _SETUP_SQL = """
         ORDER by recomp_addr;
 """
 
+# Statements on the per-entity hot path, hoisted here so every call site
+# passes the identical string to sqlite's prepared-statement cache.
+_SQL_GET_BY_ORIG = (
+    "SELECT orig_addr, recomp_addr, kvstore FROM entities WHERE orig_addr = ?"
+)
+
+_SQL_GET_BY_RECOMP = (
+    "SELECT orig_addr, recomp_addr, kvstore FROM entities WHERE recomp_addr = ?"
+)
+
+_SQL_SEARCH_SYMBOL = """SELECT orig_addr, recomp_addr, kvstore FROM entities
+    WHERE json_extract(kvstore, '$.symbol') = ?"""
+
+_SQL_SEARCH_NAME = """SELECT orig_addr, recomp_addr, kvstore FROM entities
+    WHERE json_extract(kvstore, '$.name') = ?
+    AND (json_extract(kvstore, '$.type') IS NULL OR json_extract(kvstore, '$.type') = ?)"""
+
+_SQL_COUNT_NAME_TYPE = """SELECT count(rowid) from entities
+    where json_extract(kvstore,'$.name') = ?
+    AND json_extract(kvstore,'$.type') = ?"""
+
 
 EntityTypeLookup: dict[int, str] = {
     value: name for name, value in EntityType.__members__.items()
@@ -35,11 +62,16 @@ EntityTypeLookup: dict[int, str] = {
 
 
 class ReccmpEntity:
-    """ORM object for Reccmp database entries."""
+    """ORM object for Reccmp database entries.
+    Uses __slots__ to keep the per-instance size down:
+    a compare run can create many thousands of these."""
+
+    __slots__ = ("_orig_addr", "_recomp_addr", "_kvstore", "_options")
 
     _orig_addr: int | None
     _recomp_addr: int | None
     _kvstore: str
+    _options: dict[str, Any] | None
 
     def __init__(
         self, orig: int | None, recomp: int | None, kvstore: str = "{}"
@@ -49,10 +81,15 @@ class ReccmpEntity:
         self._orig_addr = orig
         self._recomp_addr = recomp
         self._kvstore = kvstore
+        self._options = None
 
-    @cached_property
+    @property
     def options(self) -> dict[str, Any]:
-        return json.loads(self._kvstore)
+        """Parse the JSON kvstore on first use and keep the result."""
+        if self._options is None:
+            self._options = json.loads(self._kvstore)
+
+        return self._options
 
     @property
     def orig_addr(self) -> int | None:
@@ -68,7 +105,12 @@ class ReccmpEntity:
 
     @property
     def name(self) -> str | None:
-        return self.options.get("name")
+        name = self.options.get("name")
+        if name is None and (thunked := self.options.get("thunk_name")) is not None:
+            # Thunk entities store only the name of the thunked function.
+            return f"Thunk of '{thunked}'"
+
+        return name
 
     @property
     def size(self) -> int:
@@ -89,6 +131,9 @@ class ReccmpEntity:
             if (value := self.options.get(key)) is not None:
                 return str(value)
 
+        if (thunked := self.options.get("thunk_name")) is not None:
+            return f"Thunk of '{thunked}'"
+
         return None
 
     def match_name(self) -> str | None:
@@ -123,6 +168,8 @@ class ReccmpMatch(ReccmpEntity):
     """To simplify type checking, use this object when a "match" is
     required or expected. Meaning: both orig and recomp addresses are set."""
 
+    __slots__ = ()
+
     def __init__(self, orig: int, recomp: int, kvstore: str = "{}") -> None:
         assert orig is not None and recomp is not None
         super().__init__(orig, recomp, kvstore)
@@ -241,6 +288,12 @@ class EntityDb:
         self._sql.executescript(_SETUP_SQL)
         self._indexed = set()
 
+        # Sorted snapshots of the orig and recomp addresses, built on demand
+        # for the closest-address search and discarded whenever an address
+        # column changes. Cheaper than a SQL query per lookup.
+        self._orig_addrs: list[int] | None = None
+        self._recomp_addrs: list[int] | None = None
+
     @property
     def sql(self) -> sqlite3.Connection:
         return self._sql
@@ -248,46 +301,62 @@ class EntityDb:
     def batch(self) -> EntityBatch:
         return EntityBatch(self)
 
+    def analyze(self):
+        """Collect statistics for the sqlite query planner.
+        Should run once after the db is populated and before the match phase
+        so queries with more than one usable index pick the cheaper one.
+        Create the search indexes first: ANALYZE only sees indexes that
+        already exist."""
+        self._ensure_symbol_index()
+        self._ensure_name_index()
+        self._sql.executescript("ANALYZE; PRAGMA optimize;")
+
     def count(self) -> int:
         (count,) = self._sql.execute("SELECT count(1) from entities").fetchone()
         return count
 
     def set_orig_symbol(self, addr: int, **kwargs):
-        self.bulk_orig_insert(iter([(addr, kwargs)]))
+        self.bulk_orig_insert(((addr, kwargs),))
 
     def set_recomp_symbol(self, addr: int, **kwargs):
-        self.bulk_recomp_insert(iter([(addr, kwargs)]))
+        self.bulk_recomp_insert(((addr, kwargs),))
 
     def bulk_orig_insert(
         self, rows: Iterable[tuple[int, dict[str, Any]]], upsert: bool = False
     ):
+        self._orig_addrs = None
+        # Bind json.dumps once instead of once per row.
+        dumps = json.dumps
         if upsert:
             self._sql.executemany(
                 """INSERT INTO entities (orig_addr, kvstore) values (?,?)
                 ON CONFLICT (orig_addr) DO UPDATE
                 SET kvstore = json_patch(kvstore, excluded.kvstore)""",
-                ((addr, json.dumps(values)) for addr, values in rows),
+                ((addr, dumps(values)) for addr, values in rows),
             )
         else:
             self._sql.executemany(
                 "INSERT or ignore INTO entities (orig_addr, kvstore) values (?,?)",
-                ((addr, json.dumps(values)) for addr, values in rows),
+                ((addr, dumps(values)) for addr, values in rows),
             )
 
     def bulk_recomp_insert(
         self, rows: Iterable[tuple[int, dict[str, Any]]], upsert: bool = False
     ):
+        self._recomp_addrs = None
+        # Bind json.dumps once instead of once per row.
+        dumps = json.dumps
         if upsert:
             self._sql.executemany(
                 """INSERT INTO entities (recomp_addr, kvstore) values (?,?)
                 ON CONFLICT (recomp_addr) DO UPDATE
                 SET kvstore = json_patch(kvstore, excluded.kvstore)""",
-                ((addr, json.dumps(values)) for addr, values in rows),
+                ((addr, dumps(values)) for addr, values in rows),
             )
         else:
             self._sql.executemany(
                 "INSERT or ignore INTO entities (recomp_addr, kvstore) values (?,?)",
-                ((addr, json.dumps(values)) for addr, values in rows),
+                ((addr, dumps(values)) for addr, values in rows),
             )
 
     def bulk_match(self, pairs: Iterable[tuple[int, int]]):
@@ -295,6 +364,10 @@ class EntityDb:
         # We need to iterate over this multiple times.
         pairlist = list(pairs)
 
+        # Matching patches orig addresses into recomp rows and deletes the orig-only rows.
+        self._orig_addrs = None
+        self._recomp_addrs = None
+
         with self._sql:
             # Copy orig information to recomp side. Prefer recomp information except for NULLS.
             # json_patch(X, Y) copies keys from Y into X and replaces existing values.
@@ -322,7 +395,10 @@ class EntityDb:
             (EntityType.STRING,),
         )
 
-        return [string for (string,) in cur.fetchall()]
+        # Stream the cursor instead of calling fetchall() so the rows are not
+        # materialized twice. We still return a list: the caller matches
+        # strings (and thereby writes to the table) while iterating.
+        return [string for (string,) in cur]
 
     def get_all(self) -> Iterator[ReccmpEntity]:
         cur = self._sql.execute(
@@ -353,32 +429,35 @@ class EntityDb:
         return cur.fetchone()
 
     def _get_closest_orig(self, addr: int) -> int | None:
-        for (value,) in self._sql.execute(
-            "SELECT orig_addr FROM entities WHERE ? >= orig_addr ORDER BY orig_addr desc LIMIT 1",
-            (addr,),
-        ):
-            return value
+        if self._orig_addrs is None:
+            self._orig_addrs = [
+                value
+                for (value,) in self._sql.execute(
+                    "SELECT orig_addr FROM entities WHERE orig_addr is not null ORDER BY orig_addr"
+                )
+            ]
 
-        return None
+        i = bisect_right(self._orig_addrs, addr)
+        return self._orig_addrs[i - 1] if i > 0 else None
 
     def _get_closest_recomp(self, addr: int) -> int | None:
-        for (value,) in self._sql.execute(
-            "SELECT recomp_addr FROM entities WHERE ? >= recomp_addr ORDER BY recomp_addr desc LIMIT 1",
-            (addr,),
-        ):
-            return value
+        if self._recomp_addrs is None:
+            self._recomp_addrs = [
+                value
+                for (value,) in self._sql.execute(
+                    "SELECT recomp_addr FROM entities WHERE recomp_addr is not null ORDER BY recomp_addr"
+                )
+            ]
 
-        return None
+        i = bisect_right(self._recomp_addrs, addr)
+        return self._recomp_addrs[i - 1] if i > 0 else None
 
     def get_by_orig(self, orig: int, exact: bool = True) -> ReccmpEntity | None:
         addr = self._get_closest_orig(orig)
         if addr is None or exact and orig != addr:
             return None
 
-        cur = self._sql.execute(
-            "SELECT orig_addr, recomp_addr, kvstore FROM entities WHERE orig_addr = ?",
-            (addr,),
-        )
+        cur = self._sql.execute(_SQL_GET_BY_ORIG, (addr,))
         cur.row_factory = entity_factory
         return cur.fetchone()
 
@@ -387,10 +466,7 @@ class EntityDb:
         if addr is None or exact and recomp != addr:
             return None
 
-        cur = self._sql.execute(
-            "SELECT orig_addr, recomp_addr, kvstore FROM entities WHERE recomp_addr = ?",
-            (addr,),
-        )
+        cur = self._sql.execute(_SQL_GET_BY_RECOMP, (addr,))
         cur.row_factory = entity_factory
         return cur.fetchone()
 
@@ -410,23 +486,30 @@ class EntityDb:
         cur = self._sql.execute("SELECT 1 FROM entities WHERE orig_addr = ?", (addr,))
         return cur.fetchone() is not None
 
-    def _recomp_used(self, addr: int) -> bool:
-        cur = self._sql.execute("SELECT 1 FROM entities WHERE recomp_addr = ?", (addr,))
-        return cur.fetchone() is not None
-
     def set_pair(
         self, orig: int, recomp: int, entity_type: EntityType | None = None
     ) -> bool:
-        if self._orig_used(orig):
-            logger.debug("Original address %s not unique!", hex(orig))
-            return False
-
+        # Guard against a reused orig addr inside the UPDATE itself
+        # so the check and the write are a single statement.
         cur = self._sql.execute(
-            "UPDATE entities SET orig_addr = ?, kvstore=json_set(kvstore,'$.type',?) WHERE recomp_addr = ?",
-            (orig, entity_type, recomp),
+            """UPDATE entities SET orig_addr = ?, kvstore=json_set(kvstore,'$.type',?)
+            WHERE recomp_addr = ?
+            AND NOT EXISTS (SELECT 1 FROM entities WHERE orig_addr = ?)""",
+            (orig, entity_type, recomp, orig),
         )
 
-        return cur.rowcount > 0
+        if cur.rowcount > 0:
+            # Single-row write: update the snapshot in place instead of
+            # forcing a full rebuild on the next closest-address search.
+            if self._orig_addrs is not None:
+                insort(self._orig_addrs, orig)
+
+            return True
+
+        if self._orig_used(orig):
+            logger.debug("Original address %s not unique!", hex(orig))
+
+        return False
 
     def set_pair_tentative(
         self, orig: int, recomp: int, entity_type: EntityType | None = None
@@ -438,24 +521,47 @@ class EntityDb:
 
         The purpose here is to set matches found via some automated analysis
         but to not overwrite a match provided by the human operator."""
-        if self._orig_used(orig):
-            # Probable and expected situation. Just ignore it.
-            return False
-
+        # A reused orig addr is a probable and expected situation;
+        # the NOT EXISTS guard just makes the UPDATE a no-op.
         cur = self._sql.execute(
             """UPDATE entities
             SET orig_addr = ?, kvstore = json_insert(kvstore,'$.type',?)
             WHERE recomp_addr = ?
-            AND orig_addr IS NULL""",
-            (orig, entity_type, recomp),
+            AND orig_addr IS NULL
+            AND NOT EXISTS (SELECT 1 FROM entities WHERE orig_addr = ?)""",
+            (orig, entity_type, recomp, orig),
         )
 
-        return cur.rowcount > 0
+        if cur.rowcount > 0:
+            if self._orig_addrs is not None:
+                insort(self._orig_addrs, orig)
+
+            return True
+
+        return False
+
+    def bulk_set_pair(
+        self, pairs: Iterable[tuple[int, int]], entity_type: EntityType | None = None
+    ):
+        """set_pair for many (orig_addr, recomp_addr) pairs in a single
+        statement. Unlike set_pair, there is no per-pair success report:
+        pairs with a reused orig address are silently skipped."""
+        self._orig_addrs = None
+        with self._sql:
+            self._sql.executemany(
+                """UPDATE entities SET orig_addr = ?, kvstore=json_set(kvstore,'$.type',?)
+                WHERE recomp_addr = ?
+                AND NOT EXISTS (SELECT 1 FROM entities WHERE orig_addr = ?)""",
+                ((orig, entity_type, recomp, orig) for orig, recomp in pairs),
+            )
 
     def set_function_pair(self, orig: int, recomp: int) -> bool:
         """For lineref match or _entry"""
         return self.set_pair(orig, recomp, EntityType.FUNCTION)
 
+    def bulk_set_function_pair(self, pairs: Iterable[tuple[int, int]]):
+        return self.bulk_set_pair(pairs, EntityType.FUNCTION)
+
     def set_function_pair_tentative(self, orig: int, recomp: int) -> bool:
         """For lineref match or _entry"""
         return self.set_pair_tentative(orig, recomp, EntityType.FUNCTION)
@@ -463,41 +569,53 @@ class EntityDb:
     def create_orig_thunk(self, addr: int, name: str) -> bool:
         """Create a thunk function reference using the orig address.
         We are here because we have a match on the thunked function,
-        but it is not thunked in the recomp build."""
+        but it is not thunked in the recomp build.
 
-        if self._orig_used(addr):
-            return False
+        Store only the name of the thunked function; the "Thunk of" prefix
+        is synthesized by ReccmpEntity at display time."""
 
-        thunk_name = f"Thunk of '{name}'"
-
-        # Assuming relative jump instruction for thunks (5 bytes)
+        # Assuming relative jump instruction for thunks (5 bytes).
+        # The unique constraint on orig_addr rejects a reused address.
         cur = self._sql.execute(
-            """INSERT INTO entities (orig_addr, kvstore)
-            VALUES (:addr, json_insert('{}', '$.type', :type, '$.name', :name, '$.size', :size))""",
-            {"addr": addr, "type": EntityType.FUNCTION, "name": thunk_name, "size": 5},
+            """INSERT or ignore INTO entities (orig_addr, kvstore)
+            VALUES (:addr, json_insert('{}', '$.type', :type, '$.thunk_name', :name, '$.size', :size))""",
+            {"addr": addr, "type": EntityType.FUNCTION, "name": name, "size": 5},
         )
 
-        return cur.rowcount > 0
+        if cur.rowcount > 0:
+            # Single-row write: update the snapshot in place instead of
+            # forcing a full rebuild on the next closest-address search.
+            if self._orig_addrs is not None:
+                insort(self._orig_addrs, addr)
+
+            return True
+
+        return False
 
     def create_recomp_thunk(self, addr: int, name: str) -> bool:
         """Create a thunk function reference using the recomp address.
         We start from the recomp side for this because we are guaranteed
         to have full information from the PDB. We can use a regular function
-        match later to pull in the orig address."""
-
-        if self._recomp_used(addr):
-            return False
+        match later to pull in the orig address.
 
-        thunk_name = f"Thunk of '{name}'"
+        Store only the name of the thunked function; the "Thunk of" prefix
+        is synthesized by ReccmpEntity at display time."""
 
-        # Assuming relative jump instruction for thunks (5 bytes)
+        # Assuming relative jump instruction for thunks (5 bytes).
+        # The unique constraint on recomp_addr rejects a reused address.
         cur = self._sql.execute(
-            """INSERT INTO entities (recomp_addr, kvstore)
-            VALUES (:addr, json_insert('{}', '$.type', :type, '$.name', :name, '$.size', :size))""",
-            {"addr": addr, "type": EntityType.FUNCTION, "name": thunk_name, "size": 5},
+            """INSERT or ignore INTO entities (recomp_addr, kvstore)
+            VALUES (:addr, json_insert('{}', '$.type', :type, '$.thunk_name', :name, '$.size', :size))""",
+            {"addr": addr, "type": EntityType.FUNCTION, "name": name, "size": 5},
         )
 
-        return cur.rowcount > 0
+        if cur.rowcount > 0:
+            if self._recomp_addrs is not None:
+                insort(self._recomp_addrs, addr)
+
+            return True
+
+        return False
 
     def _set_opt_bool(self, addr: int, option: str, enabled: bool = True):
         self._sql.execute(
@@ -505,92 +623,103 @@ class EntityDb:
             (json.dumps({option: enabled}), addr),
         )
 
+    def _bulk_set_opt_bool(self, addrs: Iterable[int], option: str):
+        """Set the given option to True on each orig address in one statement."""
+        patch = json.dumps({option: True})
+        with self._sql:
+            self._sql.executemany(
+                "UPDATE entities SET kvstore = json_patch(kvstore,?) where orig_addr = ?",
+                ((patch, addr) for addr in addrs),
+            )
+
     def mark_stub(self, orig: int):
         self._set_opt_bool(orig, "stub")
 
     def skip_compare(self, orig: int):
         self._set_opt_bool(orig, "skip")
 
+    def bulk_skip_compare(self, origs: Iterable[int]):
+        self._bulk_set_opt_bool(origs, "skip")
+
+    def fix_vtordisp_names(self):
+        """The PDB will sometimes reuse the name of the thunked function
+        for a vtordisp thunk. Demangle the decorated names of all candidate
+        functions in one pass and batch the corrections so is_vtordisp()
+        can be a read-only query.
+
+        A row without a decorated name cannot be corrected. This happens in
+        debug builds, e.g. for "Thunk of 'LegoAnimActor::ClassName'"."""
+        updates = [
+            (new_name, recomp_addr)
+            for (recomp_addr, decorated_name) in self._sql.execute(
+                """SELECT recomp_addr, json_extract(kvstore,'$.symbol')
+                FROM entities
+                WHERE recomp_addr is not null
+                AND json_extract(kvstore,'$.symbol') is not null
+                AND (json_extract(kvstore,'$.type') = ? OR json_extract(kvstore,'$.type') is null)
+                AND ifnull(instr(json_extract(kvstore,'$.name'), '`vtordisp'), 0) = 0""",
+                (EntityType.FUNCTION,),
+            )
+            if (new_name := get_vtordisp_name(decorated_name)) is not None
+        ]
+
+        with self._sql:
+            self._sql.executemany(
+                """UPDATE entities
+                SET kvstore = json_set(kvstore, '$.name', ?)
+                WHERE recomp_addr = ?""",
+                updates,
+            )
+
     def is_vtordisp(self, recomp_addr: int) -> bool:
-        """Check whether this function is a vtordisp based on its
-        decorated name. If its demangled name is missing the vtordisp
-        indicator, correct that."""
+        """Check whether this function is a vtordisp based on its name.
+        Requires fix_vtordisp_names() to have patched up any vtordisp
+        functions whose name is missing the indicator."""
         row = self._sql.execute(
-            """SELECT json_extract(kvstore,'$.name'), json_extract(kvstore,'$.symbol')
-            FROM entities
-            WHERE recomp_addr = ?""",
+            """SELECT 1 FROM entities
+            WHERE recomp_addr = ?
+            AND instr(json_extract(kvstore,'$.name'), '`vtordisp') > 0""",
             (recomp_addr,),
         ).fetchone()
 
-        if row is None:
-            return False
-
-        (name, decorated_name) = row
-        if "`vtordisp" in name:
-            return True
-
-        if decorated_name is None:
-            # happens in debug builds, e.g. for "Thunk of 'LegoAnimActor::ClassName'"
-            return False
+        return row is not None
 
-        new_name = get_vtordisp_name(decorated_name)
-        if new_name is None:
-            return False
-
-        self._sql.execute(
-            """UPDATE entities
-            SET kvstore = json_set(kvstore, '$.name', ?)
-            WHERE recomp_addr = ?""",
-            (new_name, recomp_addr),
-        )
-
-        return True
-
-    def search_symbol(self, symbol: str) -> Iterator[ReccmpEntity]:
+    def _ensure_symbol_index(self):
         if "symbol" not in self._indexed:
             self._sql.execute(
                 "CREATE index idx_symbol on entities(json_extract(kvstore, '$.symbol'))"
             )
             self._indexed.add("symbol")
 
-        cur = self._sql.execute(
-            """SELECT orig_addr, recomp_addr, kvstore FROM entities
-            WHERE json_extract(kvstore, '$.symbol') = ?""",
-            (symbol,),
-        )
-        cur.row_factory = entity_factory
-        yield from cur
-
-    def search_name(self, name: str, entity_type: EntityType) -> Iterator[ReccmpEntity]:
+    def _ensure_name_index(self):
         if "name" not in self._indexed:
+            # Composite index: the queries below filter on type as well as name,
+            # so this saves a row fetch for each name collision.
             self._sql.execute(
-                "CREATE index idx_name on entities(json_extract(kvstore, '$.name'))"
+                """CREATE index idx_name on entities(
+                json_extract(kvstore, '$.name'), json_extract(kvstore, '$.type'))"""
             )
             self._indexed.add("name")
 
+    def search_symbol(self, symbol: str) -> Iterator[ReccmpEntity]:
+        self._ensure_symbol_index()
+
+        cur = self._sql.execute(_SQL_SEARCH_SYMBOL, (symbol,))
+        cur.row_factory = entity_factory
+        yield from cur
+
+    def search_name(self, name: str, entity_type: EntityType) -> Iterator[ReccmpEntity]:
+        self._ensure_name_index()
+
         # n.b. If the name matches and the type is not set, we will return the row.
         # Ideally we would have perfect information on the recomp side and not need to do this
-        cur = self._sql.execute(
-            """SELECT orig_addr, recomp_addr, kvstore FROM entities
-            WHERE json_extract(kvstore, '$.name') = ?
-            AND (json_extract(kvstore, '$.type') IS NULL OR json_extract(kvstore, '$.type') = ?)""",
-            (name, entity_type),
-        )
+        cur = self._sql.execute(_SQL_SEARCH_NAME, (name, entity_type))
         cur.row_factory = entity_factory
         yield from cur
 
-    def _match_on(self, entity_type: EntityType, addr: int, name: str) -> bool:
+    def _match_on_name(self, entity_type: EntityType, addr: int, name: str) -> bool:
         """Search the program listing for the given name and type, then assign the
         given address to the first unmatched result."""
-        # If we identify the name as a linker symbol, search for that instead.
-        # TODO: Will need a customizable "name_is_symbol" function for other platforms
-        if entity_type != EntityType.STRING and name.startswith("?"):
-            for obj in self.search_symbol(name):
-                if obj.orig_addr is None and obj.recomp_addr is not None:
-                    return self.set_pair(addr, obj.recomp_addr, entity_type)
-
-            return False
-
         # Truncate the name to 255 characters. It will not be possible to match a name
         # longer than that because MSVC truncates to this length.
         # See also: warning C4786.
@@ -602,10 +731,7 @@ class EntityDb:
 
                 # Type field has been set by set_pair, so we can use it in our count query:
                 (count,) = self._sql.execute(
-                    """SELECT count(rowid) from entities
-                    where json_extract(kvstore,'$.name') = ?
-                    AND json_extract(kvstore,'$.type') = ?""",
-                    (name, entity_type),
+                    _SQL_COUNT_NAME_TYPE, (name, entity_type)
                 ).fetchone()
 
                 if matched and count > 1:
@@ -636,7 +762,7 @@ class EntityDb:
         return result[0] if result is not None else None
 
     def match_string(self, addr: int, value: str) -> bool:
-        did_match = self._match_on(EntityType.STRING, addr, value)
+        did_match = self._match_on_name(EntityType.STRING, addr, value)
         if not did_match:
             already_present = self.get_by_orig(addr, exact=True)
             escaped = repr(value)
@@ -226,6 +226,23 @@ def match_static_variables(
 
     Requirement #1 is most likely to be met by matching the entity with recomp data.
     Therefore, this function should be called after match_symbols or match_functions."""
+
+    # Index the symbols of candidate recomp entities up front.
+    # A full-text search for each variable replaces the leading-wildcard
+    # LIKE scan of every unmatched symbol that we used previously.
+    db.sql.execute("DROP TABLE IF EXISTS temp.static_var_fts")
+    db.sql.execute("CREATE VIRTUAL TABLE temp.static_var_fts USING fts5(symbol)")
+    db.sql.executemany(
+        "INSERT INTO temp.static_var_fts (rowid, symbol) values (?,?)",
+        db.sql.execute(
+            """SELECT recomp_addr, json_extract(kvstore, '$.symbol') as symbol
+            FROM recomp_unmatched
+            where (json_extract(kvstore, '$.type') = ? OR json_extract(kvstore, '$.type') IS NULL)
+            and symbol is not null""",
+            (EntityType.DATA,),
+        ),
+    )
+
     with db.batch() as batch:
         for (
             variable_addr,
@@ -252,11 +269,14 @@ def match_static_variables(
             # e.g. Static variable "g_startupDelay" from function "IsleApp::Tick"
             # The function symbol is:                    "?Tick@IsleApp@@QAEXH@Z"
             # The variable symbol is: "?g_startupDelay@?1??Tick@IsleApp@@QAEXH@Z@4HA"
+            # Both names are quoted so fts5 treats them as phrases,
+            # not as its own query syntax.
+            var_phrase = variable_name.replace('"', '""')
+            func_phrase = function_symbol.replace('"', '""')
+            fts_query = f'"{var_phrase}" AND "{func_phrase}"'
             for (recomp_addr,) in db.sql.execute(
-                """SELECT recomp_addr FROM recomp_unmatched
-                where (json_extract(kvstore, '$.type') = ? OR json_extract(kvstore, '$.type') IS NULL)
-                and json_extract(kvstore, '$.symbol') LIKE '%' || ? || '%' || ? || '%'""",
-                (EntityType.DATA, variable_name, function_symbol),
+                "SELECT rowid FROM temp.static_var_fts where symbol MATCH ?",
+                (fts_query,),
             ):
                 batch.match(variable_addr, recomp_addr)
                 break
@@ -267,6 +287,8 @@ def match_static_variables(
                     msg=f"Failed to match static variable {variable_name} from function {function_name} annotated with 0x{variable_addr:x}",
                 )
 
+    db.sql.execute("DROP TABLE temp.static_var_fts")
+
 
 def match_variables(db: EntityDb, report: ReccmpReportProtocol = reccmp_report_nop):
     var_name_index = EntityIndex()
@@ -274,6 +296,8 @@ def match_variables(db: EntityDb, report: ReccmpReportProtocol = reccmp_report_n
     # TODO: We allow a match if entity_type is null.
     # This can be removed if we can more confidently declare a symbol is a variable
     # when adding from the PDB.
+    # n.b. Pointer variables are ingested as DATA (see cvdump analysis), so a
+    # single pass covers them; no second lookup with type POINTER is needed.
     for name, recomp_addr in db.sql.execute(
         """SELECT json_extract(kvstore, '$.name') as name, recomp_addr
         from recomp_unmatched where name is not null
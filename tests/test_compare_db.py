@@ -302,3 +302,61 @@ def test_batch_sqlite_exception_insert_only(db):
         batch.commit()
 
     assert db.get_by_orig(100) is None
+
+
+def test_set_pair_reused_orig(db):
+    """Cannot claim an orig address that is already paired elsewhere"""
+    db.set_recomp_symbol(200, name="hello")
+    db.set_recomp_symbol(300, name="world")
+
+    assert db.set_pair(100, 200) is True
+    assert db.set_pair(100, 300) is False
+    assert db.get_by_recomp(300).orig_addr is None
+
+
+def test_set_pair_tentative_reused_orig(db):
+    """set_pair_tentative rejects a reused orig address
+    and does not overwrite an existing pairing"""
+    db.set_recomp_symbol(200, name="hello")
+    db.set_recomp_symbol(300, name="world")
+
+    assert db.set_pair_tentative(100, 200) is True
+    assert db.set_pair_tentative(100, 300) is False
+    # The recomp address is already paired
+    assert db.set_pair_tentative(101, 200) is False
+    assert db.get_by_recomp(200).orig_addr == 100
+
+
+def test_bulk_set_pair_reused_orig(db):
+    """bulk_set_pair silently skips pairs with a reused orig address"""
+    db.set_recomp_symbol(200, name="hello")
+    db.set_recomp_symbol(300, name="world")
+
+    db.bulk_set_pair([(100, 200), (100, 300)])
+
+    assert db.get_by_recomp(200).orig_addr == 100
+    assert db.get_by_recomp(300).orig_addr is None
+
+
+def test_create_thunk_reused_addr(db):
+    """Thunk creation is ignored if the address is already in use"""
+    db.set_recomp_symbol(200, name="hello")
+    assert db.create_recomp_thunk(200, "hello") is False
+    assert db.create_recomp_thunk(201, "hello") is True
+
+    db.set_orig_symbol(100, name="hello")
+    assert db.create_orig_thunk(100, "hello") is False
+    assert db.create_orig_thunk(101, "hello") is True
+
+
+def test_bulk_skip_compare(db):
+    """Set the skip option on each orig address"""
+    db.set_orig_symbol(100, name="hello")
+    db.set_orig_symbol(200, name="world")
+    db.set_orig_symbol(300, name="test")
+
+    db.bulk_skip_compare([100, 200])
+
+    assert db.get_by_orig(100).get("skip") is True
+    assert db.get_by_orig(200).get("skip") is True
+    assert db.get_by_orig(300).get("skip") is None
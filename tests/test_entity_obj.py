@@ -53,6 +53,25 @@ def test_computed_name_string():
     assert "Test" in e.match_name()
 
 
+def test_thunk_name_synthesized():
+    """If only 'thunk_name' is set, synthesize the display name
+    from the thunked function's name."""
+    e = create_entity(100, 200, type=EntityType.FUNCTION, thunk_name="Hello")
+    assert e.name == "Thunk of 'Hello'"
+    assert e.best_name() == "Thunk of 'Hello'"
+    assert "Thunk of 'Hello'" in e.match_name()
+
+
+def test_thunk_name_priority():
+    """'name' and 'computed_name' take precedence over 'thunk_name'"""
+    e = create_entity(100, 200, name="Test", thunk_name="Hello")
+    assert e.name == "Test"
+    assert e.best_name() == "Test"
+
+    e = create_entity(100, 200, computed_name="Greeting", thunk_name="Hello")
+    assert e.best_name() == "Greeting"
+
+
 def test_match_name_string():
     """We currently store the string value in the name field.
     If the string includes newlines, we need to escape them before replacing the
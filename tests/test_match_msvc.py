@@ -488,6 +488,46 @@ def test_match_static_var_no_symbol_variable(db):
     assert db.get_by_orig(600).recomp_addr is None
 
 
+def test_match_static_var_partial_token(db):
+    """The variable name must match a whole token of the recomp symbol.
+    A substring of a longer identifier is not enough, even though the
+    LIKE scan used previously would have accepted it."""
+    with db.batch() as batch:
+        batch.set_orig(200, symbol="?Tick@IsleApp@@QAEXH@Z", type=EntityType.FUNCTION)
+        batch.set_recomp(500, symbol="?g_startupDelay@?1??Tick@IsleApp@@QAEXH@Z@4HA")
+        # "startup" appears inside "g_startupDelay" but is not a whole token.
+        batch.set_orig(
+            600,
+            name="startup",
+            parent_function=200,
+            static_var=True,
+            type=EntityType.DATA,
+        )
+
+    match_static_variables(db)
+
+    assert db.get_by_orig(600).recomp_addr is None
+
+
+def test_match_static_var_query_chars(db):
+    """Characters with meaning to the full-text query syntax must not
+    raise when they appear in the variable or function name."""
+    with db.batch() as batch:
+        batch.set_orig(200, symbol="?Tick@IsleApp@@QAEXH@Z", type=EntityType.FUNCTION)
+        batch.set_recomp(500, symbol="?g_startupDelay@?1??Tick@IsleApp@@QAEXH@Z@4HA")
+        batch.set_orig(
+            600,
+            name='g_"quoted" OR NOT *',
+            parent_function=200,
+            static_var=True,
+            type=EntityType.DATA,
+        )
+
+    match_static_variables(db)
+
+    assert db.get_by_orig(600).recomp_addr is None
+
+
 def test_match_static_var_no_match_report(db, report):
     """Report match failure for any orig entities with static_var=True"""
     with db.batch() as batch: